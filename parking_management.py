@@ -1,36 +1,68 @@
+import os
+
+# Tesseract's OpenMP threading slows down single-image OCR (see the Tesseract
+# FAQ on OMP_THREAD_LIMIT); pin it to one thread before any OCR import.
+os.environ.setdefault("OMP_THREAD_LIMIT", "1")
+
 import tkinter as tk
 from tkinter import ttk, messagebox, simpledialog, filedialog
+import re
 import sqlite3
+import atexit
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-import qrcode
-import os
 
-# Optional image display for QR popup
+# Optional: ANPR dependencies (not strictly required)
 try:
-    from PIL import Image, ImageTk
+    import cv2
 except ImportError:
-    Image = None
-    ImageTk = None
+    cv2 = None
 
-# Optional: ANPR dependencies (not strictly required)
 try:
-    import cv2
     import pytesseract
 except ImportError:
-    cv2 = None
     pytesseract = None
 
+# Optional: in-process Tesseract via tesserocr. One API instance is kept for
+# the app lifetime so language data loads once and no subprocess/temp file
+# is needed per read. Falls back to pytesseract when unavailable.
+try:
+    from tesserocr import PyTessBaseAPI, PSM, OEM
+    _OCR = PyTessBaseAPI(psm=PSM.SINGLE_LINE, oem=OEM.LSTM_ONLY)
+    atexit.register(_OCR.End)
+except Exception:  # ImportError, or RuntimeError when tessdata is missing
+    _OCR = None
+_OCR_LOCK = threading.Lock()  # the shared API instance is not thread-safe
+
 
 DB_NAME = "parking.db"
+TICKETS_DIR = "tickets"  # QR ticket images
 TOTAL_SLOTS = 12
 PRICE_PER_HOUR = 20  # base price per hour
+PLATE_HEIGHT = 130  # px; plate images are rescaled to this height before OCR
+TESSERACT_CONFIG = "--psm 7 --oem 1"  # single text line, LSTM engine
+QR_DISPLAY_SIZE = 200  # px; ticket QR images are rendered close to this size
+QR_BORDER = 2  # quiet-zone width in modules
+
+_PLATE_RE = re.compile(r"[^A-Za-z0-9]")  # characters stripped from OCR output
+
+# Shared SQLite connection (opened once in init_db; Tk runs on a single thread)
+_CONN = None
 
 
 # ---------- DATABASE LAYER ----------
 
 def init_db():
-    conn = sqlite3.connect(DB_NAME)
-    cur = conn.cursor()
+    global _CONN
+    if _CONN is None:
+        _CONN = sqlite3.connect(DB_NAME, isolation_level=None, check_same_thread=False)
+        _CONN.execute("PRAGMA journal_mode=WAL")
+        _CONN.execute("PRAGMA synchronous=NORMAL")
+        _CONN.row_factory = sqlite3.Row
+        atexit.register(_CONN.close)
+    cur = _CONN.cursor()
 
     # Admins
     cur.execute("""
@@ -72,34 +104,84 @@ def init_db():
             paid_at TEXT NOT NULL
         )
     """)
+    cur.execute("CREATE INDEX IF NOT EXISTS idx_payments_paid_at ON payments(paid_at DESC)")
+
+    # Running totals (kept up to date alongside payments)
+    cur.execute("""
+        CREATE TABLE IF NOT EXISTS meta (
+            key TEXT PRIMARY KEY,
+            value REAL
+        )
+    """)
+    # Seeded from existing payments the first time an older database is opened
+    cur.execute(
+        "INSERT OR IGNORE INTO meta (key, value) SELECT 'revenue', COALESCE(SUM(amount), 0) FROM payments"
+    )
 
     # Default accounts
     cur.execute("INSERT OR IGNORE INTO admins (username, password) VALUES (?, ?)", ("admin", "admin123"))
     cur.execute("INSERT OR IGNORE INTO users (username, password) VALUES (?, ?)", ("user", "user123"))
 
-    conn.commit()
-    conn.close()
+    # Ticket output directory, created once at startup rather than per booking
+    os.makedirs(TICKETS_DIR, exist_ok=True)
 
 
 def db_query(query, params=(), fetch=False):
-    """Small helper to execute queries."""
-    conn = sqlite3.connect(DB_NAME)
-    cur = conn.cursor()
-    cur.execute(query, params)
-    data = cur.fetchall() if fetch else None
-    conn.commit()
-    conn.close()
-    return data
+    """Small helper to execute queries on the shared connection (autocommit)."""
+    cur = _CONN.execute(query, params)
+    return cur.fetchall() if fetch else None
 
 
 # ---------- ANPR (AUTO NUMBER PLATE RECOGNITION) ----------
 
+def _preprocess_plate(gray):
+    """Rescales, binarises and deskews a grayscale plate image for OCR."""
+    scale = PLATE_HEIGHT / gray.shape[0]
+    gray = cv2.resize(gray, None, fx=scale, fy=scale, interpolation=cv2.INTER_CUBIC)
+    th = cv2.adaptiveThreshold(
+        gray, 255, cv2.ADAPTIVE_THRESH_GAUSSIAN_C, cv2.THRESH_BINARY, 31, 10
+    )
+
+    # Deskew using the minimum-area rectangle around the dark (text) pixels
+    coords = cv2.findNonZero(cv2.bitwise_not(th))
+    if coords is None:
+        return th
+    angle = cv2.minAreaRect(coords)[-1]
+    if angle < -45:
+        angle += 90
+    elif angle > 45:
+        angle -= 90
+    if angle:
+        h, w = th.shape[:2]
+        m = cv2.getRotationMatrix2D((w / 2, h / 2), angle, 1.0)
+        th = cv2.warpAffine(th, m, (w, h), flags=cv2.INTER_NEAREST, borderMode=cv2.BORDER_REPLICATE)
+    return th
+
+
+def _ocr_image(gray) -> str:
+    """Runs OCR on a grayscale image, preferring the persistent tesserocr API."""
+    if _OCR is not None:
+        height, width = gray.shape[:2]
+        with _OCR_LOCK:
+            _OCR.SetImageBytes(gray.tobytes(), width, height, 1, width)
+            return _OCR.GetUTF8Text()
+    return pytesseract.image_to_string(gray, config=TESSERACT_CONFIG)
+
+
+def _clean_plate(text: str) -> str:
+    """Keeps the alphanumerics of OCR output; too-short reads give "TEST1234"."""
+    text = _PLATE_RE.sub("", text).upper()
+    if len(text) < 4:
+        return "TEST1234"
+    return text[:10]
+
+
 def recognize_plate(image_path: str) -> str:
     """
     Tries to read number plate text from image using OpenCV + Tesseract.
     If dependencies are missing or fails, returns demo value "TEST1234".
     """
-    if cv2 is None or pytesseract is None:
+    if cv2 is None or (_OCR is None and pytesseract is None):
         return "TEST1234"  # demo / fallback
 
     try:
@@ -107,15 +189,83 @@ def recognize_plate(image_path: str) -> str:
         if img is None:
             return "TEST1234"
         gray = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
-        text = pytesseract.image_to_string(gray)
-        text = "".join(ch for ch in text if ch.isalnum()).upper()
-        if len(text) < 4:
-            return "TEST1234"
-        return text[:10]
+        return _clean_plate(_ocr_image(_preprocess_plate(gray)))
     except Exception:
         return "TEST1234"
 
 
+def recognize_plates(image_paths: list[str]) -> list[str]:
+    """
+    Reads several plate images in one go, e.g. for gate-camera ingest.
+    With pytesseract all images go through a single Tesseract run (image list
+    file) instead of one process per image. Unreadable images give "TEST1234".
+    """
+    if cv2 is None or (_OCR is None and pytesseract is None):
+        return ["TEST1234"] * len(image_paths)
+    if _OCR is not None:
+        # The persistent API is never re-initialised, so a plain loop is enough
+        return [recognize_plate(p) for p in image_paths]
+
+    results = ["TEST1234"] * len(image_paths)
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            batch = []  # (index into image_paths, preprocessed image path)
+            for i, path in enumerate(image_paths):
+                img = cv2.imread(path)
+                if img is None:
+                    continue
+                out_path = os.path.join(tmp, f"{i}.png")
+                cv2.imwrite(out_path, _preprocess_plate(cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)))
+                batch.append((i, out_path))
+            if not batch:
+                return results
+
+            list_path = os.path.join(tmp, "images.txt")
+            with open(list_path, "w") as f:
+                f.write("\n".join(p for _, p in batch) + "\n")
+            # Tesseract ends each page's text with a form feed
+            pages = pytesseract.image_to_string(list_path, config=TESSERACT_CONFIG).split("\f")
+            for (i, _), text in zip(batch, pages):
+                results[i] = _clean_plate(text)
+    except Exception:
+        pass
+    return results
+
+
+# ---------- QR TICKETS ----------
+
+def generate_ticket_qr(qr_text: str, qr_path: str):
+    """Renders the ticket text as a QR PNG at qr_path (about QR_DISPLAY_SIZE px)."""
+    import qrcode  # deferred: only needed when a ticket is issued
+
+    # Fixed mask pattern skips qrcode's 8-way best-mask search, which dominates
+    # generation time; low error correction keeps the symbol small.
+    qr = qrcode.QRCode(
+        error_correction=qrcode.constants.ERROR_CORRECT_L,
+        border=QR_BORDER,
+        mask_pattern=0,
+    )
+    qr.add_data(qr_text)
+    qr.make(fit=True)
+    # Render at display size so the popup can show the PNG without resampling
+    modules = qr.modules_count + 2 * QR_BORDER
+    box_size = max(1, QR_DISPLAY_SIZE // modules)
+
+    try:
+        import numpy as np
+        from PIL import Image
+    except ImportError:
+        # Slower per-module drawing through qrcode's own image factory
+        qr.box_size = box_size
+        qr.make_image().save(qr_path)
+        return
+
+    # Rasterise the whole module matrix at once: dark modules -> 0, light -> 255
+    matrix = np.pad(np.array(qr.modules, dtype=np.uint8), QR_BORDER)
+    pixels = np.kron(matrix, np.ones((box_size, box_size), dtype=np.uint8))
+    Image.fromarray(255 - 255 * pixels).save(qr_path, compress_level=1)
+
+
 # ---------- MAIN APP CLASS ----------
 
 class ParkingSystemApp:
@@ -131,6 +281,14 @@ class ParkingSystemApp:
         self.current_user = None
         self.current_role = None  # "admin" or "user"
 
+        # In-memory view of occupied slots, kept in sync on book/checkout
+        self._booked_cache = self._get_booked_slots()
+        self.slot_canvas = None
+        self._slot_rects = {}
+        self._photo_cache = {}  # qr_path -> PhotoImage
+        # Worker threads for OCR / QR rendering; DB access stays on the Tk thread
+        self._pool = ThreadPoolExecutor(max_workers=2)
+
         self.main_frame = ttk.Frame(self.root, padding=20)
         self.main_frame.pack(fill="both", expand=True)
 
@@ -172,6 +330,33 @@ class ParkingSystemApp:
         for w in self.main_frame.winfo_children():
             w.destroy()
 
+    def _run_in_background(self, func, args, on_done):
+        """Runs func(*args) on the worker pool; on_done(result, error) is called on the Tk thread."""
+        future = self._pool.submit(func, *args)
+
+        def poll():
+            if not future.done():
+                self.root.after(50, poll)
+                return
+            error = future.exception()
+            on_done(None if error else future.result(), error)
+
+        self.root.after(50, poll)
+
+    def _show_busy(self, message):
+        """Small non-modal progress window; the caller destroys it when done."""
+        win = tk.Toplevel(self.root)
+        win.title("Please wait")
+        win.transient(self.root)
+        win.configure(bg="#111827")
+        frm = ttk.Frame(win, padding=15)
+        frm.pack(fill="both", expand=True)
+        ttk.Label(frm, text=message).pack(pady=(0, 10))
+        bar = ttk.Progressbar(frm, mode="indeterminate", length=180)
+        bar.pack()
+        bar.start(10)
+        return win
+
     # ---------- LOGIN / REGISTER SCREENS ----------
 
     def _build_login_screen(self):
@@ -241,6 +426,9 @@ class ParkingSystemApp:
     # ---------- DASHBOARD ----------
 
     def _build_dashboard(self):
+        # Build on the unmapped frame and show it once, so the window lays out
+        # a single time instead of after every pack()
+        self.main_frame.pack_forget()
         self._clear_main()
 
         header = ttk.Frame(self.main_frame)
@@ -268,9 +456,11 @@ class ParkingSystemApp:
         self.grid_frame = ttk.Frame(body, style="Card.TFrame", padding=10)
         self.grid_frame.pack(side="left", fill="both", expand=True)
         ttk.Label(self.grid_frame, text="Live Slot View", font=("Segoe UI", 13, "bold")).pack(anchor="w")
-        self.slots_container = ttk.Frame(self.grid_frame)
-        self.slots_container.pack(fill="both", expand=True, pady=(10, 0))
-        self._build_slots_grid(self.slots_container)
+        slots_container = ttk.Frame(self.grid_frame)
+        slots_container.pack(fill="both", expand=True, pady=(10, 0))
+        self.slot_canvas, self._slot_rects = self._build_slots_grid(slots_container)
+
+        self.main_frame.pack(fill="both", expand=True)
 
     def _logout(self):
         self.current_user = None
@@ -284,41 +474,51 @@ class ParkingSystemApp:
         return {r[0] for r in rows}
 
     def _build_slots_grid(self, parent):
+        """Draws the slots on a single canvas; returns (canvas, {slot: rectangle id})."""
         for w in parent.winfo_children():
             w.destroy()
-        booked = self._get_booked_slots()
+        canvas = tk.Canvas(parent, bg="#1e1e1e", highlightthickness=0, width=360, height=180)
+        canvas.pack(fill="both", expand=True)
+
+        rects = {}
+        labels = {}
+        for slot in range(1, TOTAL_SLOTS + 1):
+            state = "booked" if slot in self._booked_cache else "free"
+            tag = f"slot{slot}"
+            rects[slot] = canvas.create_rectangle(
+                0, 0, 0, 0, fill=self.slot_colors[state], outline="#0f172a", tags=(tag,)
+            )
+            labels[slot] = canvas.create_text(
+                0, 0, text=f"{slot}", fill="white", font=("Segoe UI", 9, "bold"), tags=(tag,)
+            )
+            canvas.tag_bind(tag, "<Button-1>", lambda e, s=slot: self._slot_clicked(s))
 
         rows = 3
         cols = TOTAL_SLOTS // rows + (1 if TOTAL_SLOTS % rows else 0)
-        slot = 1
-        for r in range(rows):
-            for c in range(cols):
-                if slot > TOTAL_SLOTS:
-                    break
-                state = "booked" if slot in booked else "free"
-                text = f"{slot}"
-                btn = tk.Button(
-                    parent,
-                    text=text,
-                    width=8,
-                    height=2,
-                    relief="raised",
-                    bd=1,
-                    bg=self.slot_colors[state],
-                    fg="white",
-                    font=("Segoe UI", 9, "bold"),
-                    command=lambda s=slot, st=state: self._slot_clicked(s, st),
-                )
-                btn.grid(row=r, column=c, padx=5, pady=5, sticky="nsew")
-                parent.grid_rowconfigure(r, weight=1)
-                parent.grid_columnconfigure(c, weight=1)
-                slot += 1
+        pad = 5
+
+        def layout(event):
+            # Only move existing items; nothing is recreated on resize
+            cell_w = event.width / cols
+            cell_h = event.height / rows
+            for slot, rect_id in rects.items():
+                r, c = divmod(slot - 1, cols)
+                x0, y0 = c * cell_w + pad, r * cell_h + pad
+                x1, y1 = x0 + cell_w - 2 * pad, y0 + cell_h - 2 * pad
+                canvas.coords(rect_id, x0, y0, x1, y1)
+                canvas.coords(labels[slot], (x0 + x1) / 2, (y0 + y1) / 2)
+
+        canvas.bind("<Configure>", layout)
+        return canvas, rects
 
     def _refresh_grid(self):
-        self._build_slots_grid(self.slots_container)
+        # Recolour the existing rectangles instead of rebuilding the grid
+        for s, rect_id in self._slot_rects.items():
+            state = "booked" if s in self._booked_cache else "free"
+            self.slot_canvas.itemconfigure(rect_id, fill=self.slot_colors[state])
 
-    def _slot_clicked(self, slot_no, state):
-        if state == "free":
+    def _slot_clicked(self, slot_no):
+        if slot_no not in self._booked_cache:
             if messagebox.askyesno("Book Slot", f"Slot {slot_no} is free. Book it?"):
                 self._book_slot_dialog(prefilled_slot=slot_no)
         else:
@@ -363,10 +563,19 @@ class ParkingSystemApp:
             )
             if not path:
                 return
-            plate = recognize_plate(path)
-            vehicle_entry.delete(0, tk.END)
-            vehicle_entry.insert(0, plate)
-            messagebox.showinfo("ANPR Result", f"Detected Plate: {plate}")
+            busy = self._show_busy("Reading number plate...")
+            anpr_btn.state(["disabled"])
+
+            def apply(plate, error):
+                busy.destroy()
+                if not dlg.winfo_exists():
+                    return  # booking dialog was closed meanwhile
+                anpr_btn.state(["!disabled"])
+                vehicle_entry.delete(0, tk.END)
+                vehicle_entry.insert(0, plate)
+                messagebox.showinfo("ANPR Result", f"Detected Plate: {plate}", parent=dlg)
+
+            self._run_in_background(recognize_plate, (path,), apply)
 
         anpr_btn = ttk.Button(frm, text="Read from Image (ANPR)", command=do_anpr)
         anpr_btn.grid(row=2, column=2, padx=5)
@@ -385,7 +594,6 @@ class ParkingSystemApp:
                 messagebox.showwarning("Missing", "Owner and Vehicle are required.")
                 return
 
-            booked = self._get_booked_slots()
             slot_no = None
 
             if slot_pref:
@@ -393,7 +601,7 @@ class ParkingSystemApp:
                     s = int(slot_pref)
                     if not (1 <= s <= TOTAL_SLOTS):
                         raise ValueError
-                    if s in booked:
+                    if s in self._booked_cache:
                         messagebox.showerror("Slot taken", f"Slot {s} is already booked.")
                         return
                     slot_no = s
@@ -402,10 +610,7 @@ class ParkingSystemApp:
                     return
 
             if slot_no is None:
-                for s in range(1, TOTAL_SLOTS + 1):
-                    if s not in booked:
-                        slot_no = s
-                        break
+                slot_no = next((s for s in range(1, TOTAL_SLOTS + 1) if s not in self._booked_cache), None)
 
             if slot_no is None:
                 messagebox.showerror("Full", "No free slots available.")
@@ -421,19 +626,29 @@ class ParkingSystemApp:
         ttk.Button(btn_row, text="Book", command=submit).pack(side="right", padx=5)
 
     def _book_slot(self, slot_no, owner, vehicle):
-        checkin = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        checkin = datetime.now().isoformat(sep=" ", timespec="seconds")
         qr_text = f"Slot: {slot_no}\nOwner: {owner}\nVehicle: {vehicle}\nCheck-In: {checkin}"
-        os.makedirs("tickets", exist_ok=True)
-        qr_path = os.path.join("tickets", f"ticket_slot_{slot_no}.png")
-        img = qrcode.make(qr_text)
-        img.save(qr_path)
+        qr_path = os.path.join(TICKETS_DIR, f"ticket_slot_{slot_no}.png")
 
+        # The booking is recorded right away; only the ticket image is rendered
+        # off the Tk thread.
         db_query(
             "INSERT OR REPLACE INTO bookings (slot_no, owner_name, vehicle_no, checkin_time, qr_path, created_by) VALUES (?, ?, ?, ?, ?, ?)",
             (slot_no, owner, vehicle, checkin, qr_path, self.current_user or "system"),
         )
+        self._booked_cache.add(slot_no)
+
+        busy = self._show_busy(f"Generating ticket for slot {slot_no}...")
+
+        def show_ticket(_, error):
+            busy.destroy()
+            if error is not None:
+                messagebox.showerror("Ticket", f"Slot {slot_no} is booked, but the QR ticket could not be created:\n{error}")
+                return
+            self._photo_cache.pop(qr_path, None)  # the slot's ticket file was replaced
+            self._show_qr_popup(qr_path, slot_no)
 
-        self._show_qr_popup(qr_path, slot_no)
+        self._run_in_background(generate_ticket_qr, (qr_text, qr_path), show_ticket)
 
     def _show_qr_popup(self, qr_path, slot_no):
         popup = tk.Toplevel(self.root)
@@ -446,10 +661,17 @@ class ParkingSystemApp:
 
         ttk.Label(frm, text=f"QR Ticket - Slot {slot_no}", style="Title.TLabel").pack(pady=(0, 10))
 
+        # Optional image display, imported on first use to keep startup fast
+        try:
+            from PIL import Image, ImageTk
+        except ImportError:
+            Image = None
+            ImageTk = None
+
         if Image and ImageTk and os.path.exists(qr_path):
-            img = Image.open(qr_path)
-            img = img.resize((200, 200))
-            photo = ImageTk.PhotoImage(img)
+            photo = self._photo_cache.get(qr_path)
+            if photo is None:
+                photo = self._photo_cache[qr_path] = ImageTk.PhotoImage(Image.open(qr_path))
             lbl = ttk.Label(frm)
             lbl.image = photo
             lbl.configure(image=photo)
@@ -475,7 +697,7 @@ class ParkingSystemApp:
             return
 
         owner, vehicle, checkin = row[0]
-        checkin_dt = datetime.strptime(checkin, "%Y-%m-%d %H:%M:%S")
+        checkin_dt = datetime.fromisoformat(checkin)
         now = datetime.now()
         hours = max(1, int((now - checkin_dt).total_seconds() / 3600))
         amount = hours * PRICE_PER_HOUR
@@ -518,13 +740,19 @@ class ParkingSystemApp:
         def complete_payment():
             method = method_var.get()
             txn_id = txn_entry.get().strip() or None
-            paid_at = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-
-            db_query(
-                "INSERT INTO payments (slot_no, amount, hours_charged, method, txn_id, paid_at) VALUES (?, ?, ?, ?, ?, ?)",
-                (slot_no, amount, hours, method, txn_id, paid_at),
-            )
-            db_query("DELETE FROM bookings WHERE slot_no=?", (slot_no,))
+            paid_at = datetime.now().isoformat(sep=" ", timespec="seconds")
+
+            # Record payment and free the slot in one transaction (single commit).
+            # The connection is in autocommit mode, so BEGIN is explicit.
+            with _CONN:
+                _CONN.execute("BEGIN")
+                _CONN.execute(
+                    "INSERT INTO payments (slot_no, amount, hours_charged, method, txn_id, paid_at) VALUES (?, ?, ?, ?, ?, ?)",
+                    (slot_no, amount, hours, method, txn_id, paid_at),
+                )
+                _CONN.execute("DELETE FROM bookings WHERE slot_no=?", (slot_no,))
+                _CONN.execute("UPDATE meta SET value = value + ? WHERE key='revenue'", (amount,))
+            self._booked_cache.discard(slot_no)
             dlg.destroy()
             self._refresh_grid()
             messagebox.showinfo("Payment successful", "Checkout and payment completed.")
@@ -547,9 +775,9 @@ class ParkingSystemApp:
 
     def _show_summary(self):
         total = TOTAL_SLOTS
-        booked = len(self._get_booked_slots())
+        booked = len(self._booked_cache)
         free = total - booked
-        paid_rows = db_query("SELECT SUM(amount) FROM payments", fetch=True)
+        paid_rows = db_query("SELECT value FROM meta WHERE key='revenue'", fetch=True)
         total_revenue = paid_rows[0][0] if paid_rows and paid_rows[0][0] is not None else 0
         messagebox.showinfo(
             "Summary",
@@ -557,14 +785,55 @@ class ParkingSystemApp:
         )
 
     def _view_payments(self):
-        rows = db_query("SELECT slot_no, amount, method, paid_at FROM payments ORDER BY paid_at DESC", fetch=True)
+        # One cursor streams the listing page by page; nothing is materialised up front
+        cur = _CONN.execute("SELECT slot_no, amount, method, paid_at FROM payments ORDER BY paid_at DESC")
+        cur.arraysize = 1000
+        rows = cur.fetchmany()
         if not rows:
+            cur.close()
             messagebox.showinfo("Payments", "No payments recorded yet.")
             return
-        lines = []
-        for slot_no, amount, method, paid_at in rows:
-            lines.append(f"Slot {slot_no} | ₹{amount} | {method} | {paid_at}")
-        messagebox.showinfo("Payments", "\n".join(lines))
+
+        win = tk.Toplevel(self.root)
+        win.title("Payments")
+        win.geometry("600x400")
+        win.configure(bg="#111827")
+        win.protocol("WM_DELETE_WINDOW", lambda: (cur.close(), win.destroy()))
+        frm = ttk.Frame(win, padding=10)
+        frm.pack(fill="both", expand=True)
+
+        columns = ("slot", "amount", "method", "paid_at")
+        tree = ttk.Treeview(frm, columns=columns, show="headings")
+        for col, heading, width in (
+            ("slot", "Slot", 60),
+            ("amount", "Amount (₹)", 100),
+            ("method", "Method", 80),
+            ("paid_at", "Paid At", 160),
+        ):
+            tree.heading(col, text=heading)
+            tree.column(col, width=width, anchor="center")
+        scroll = ttk.Scrollbar(frm, orient="vertical", command=tree.yview)
+        tree.pack(side="left", fill="both", expand=True)
+        scroll.pack(side="right", fill="y")
+
+        exhausted = False
+
+        def add_rows(batch):
+            nonlocal exhausted
+            for r in batch:
+                tree.insert("", "end", values=(r["slot_no"], r["amount"], r["method"], r["paid_at"]))
+            exhausted = len(batch) < cur.arraysize
+            if exhausted:
+                cur.close()
+
+        def on_scroll(first, last):
+            # Fetch the next page once the user scrolls to the end
+            scroll.set(first, last)
+            if float(last) >= 1.0 and not exhausted:
+                add_rows(cur.fetchmany())
+
+        tree.configure(yscrollcommand=on_scroll)
+        add_rows(rows)
 
 
 # ---------- RUN APP ----------